@@ -1,79 +1,183 @@
 from __future__ import annotations
 
+import json
 import os
 import re
+import shutil
 import sys
+import time
 from pathlib import Path
 import argparse
-from typing import Iterable, List, Set, Dict
+from collections import defaultdict, deque
+from contextlib import suppress
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
+from typing import Any, DefaultDict, Deque, Iterable, Iterator, List, Set, Dict
+from html import unescape
 from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+import urllib3
+from urllib3.util import Retry
 
 
 URL = "https://riftbound.leagueoflegends.com/en-us/tcg-cards/"
 OUT_DIR = Path("images")
+CDN_HOST_HINT = "cdn.rgpub.io"
+MAX_WORKERS = 32
+PROBE_WINDOW = 32
+# Most card images are 100 KB - 2 MB, so a 1 MiB copy chunk writes each in one or two syscalls
+COPY_CHUNK = 1 << 20
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Retry transient failures inside the connection pool, keeping the warm connections
+RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=RETRY_STATUSES,
+    allowed_methods=("GET", "HEAD"),
+    respect_retry_after_header=True,
+)
+CACHE_NAME = ".cache.json"
+MISS_TTL = 24 * 60 * 60
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0.0.0 Safari/537.36"
+    ),
+    # Brotli shrinks the card index HTML well beyond gzip; decoded transparently via `brotli`
+    "Accept-Encoding": "gzip, deflate, br",
+}
+
+
+def make_session(pool_size: int = MAX_WORKERS) -> requests.Session:
+    """
+    Build a keep-alive session whose connection pool is large enough for `pool_size`
+    concurrent workers, so TLS handshakes are paid once per connection, not per request.
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=RETRY,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
-def parse_srcset(srcset: str) -> List[str]:
-    # Accept entries like: url 1x, url 2x OR url 320w, url 640w
-    urls: List[str] = []
-    for part in srcset.split(","):
-        url = part.strip().split(" ")[0].strip()
-        if url:
-            urls.append(url)
-    return urls
+def make_cdn_pool(pool_size: int = PROBE_WINDOW) -> urllib3.HTTPSConnectionPool:
+    """
+    Build a bare urllib3 pool pinned to the card CDN for the fallback probe loop, which
+    issues thousands of requests and gains nothing from `requests`' per-request machinery.
+    """
+    return urllib3.HTTPSConnectionPool(
+        CDN_HOST_HINT,
+        maxsize=pool_size,
+        block=True,
+        headers=HEADERS,
+        retries=RETRY,
+        timeout=urllib3.Timeout(30),
+    )
 
 
-CDN_HOST_HINT = "cdn.rgpub.io"
+# Accept entries like: url 1x, url 2x OR url 320w, url 640w
+SRCSET_RE = re.compile(r"([^\s,]+)(?:\s+[^,]+)?,?")
+STYLE_URL_RE = re.compile(r'url\((?:"|\')?(.*?)(?:"|\')?\)')
+CDN_IMG_RE = re.compile(
+    r"https?://[\w.-]*/public/[\w/-]*/riftbound/[\w/-]*/[\w-]*/cards/[\w-]*/(?:full|thumbnail)[^\s'\"]*\.(?:jpg|jpeg|png|webp)",
+    re.IGNORECASE,
+)
+# One sweep over the raw HTML for every place an image URL can appear: src/srcset-style
+# attributes, CSS url(...) references, and bare CDN card URLs embedded in scripts
+HTML_URL_RE = re.compile(
+    # Attributes must follow whitespace (so `img.src = "..."` in inline JS is skipped), and
+    # quoted values may span lines, as multi-line srcset lists often do; unquoted values end
+    # at whitespace or the closing `>`
+    r"""(?<=\s)(?P<attr>data-srcset|data-src|srcset|src)\s*=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<uq>[^\s"'>]+))"""
+    r"""|url\(\s*["']?(?P<css>[^)"']+)"""
+    r"""|(?P<cdn>""" + CDN_IMG_RE.pattern + ")",
+    re.IGNORECASE,
+)
+# Below this many image URLs the regex sweep is assumed to have missed markup it
+# does not understand, and extraction falls back to a full DOM walk
+MIN_SCAN_HITS = 10
+
+
+def parse_srcset(srcset: str) -> Iterator[str]:
+    return (m.group(1) for m in SRCSET_RE.finditer(srcset))
+
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp", ".gif")
 
 
 def extract_image_urls(html: str, base_url: str) -> List[str]:
-    soup = BeautifulSoup(html, "html.parser")
+    result = filter_image_urls(scan_image_urls(html, base_url))
+    if len(result) < MIN_SCAN_HITS:
+        result = filter_image_urls(soup_image_urls(html, base_url))
+    return result
+
+
+def scan_image_urls(html: str, base_url: str) -> Iterator[str]:
+    # A generator, so filter_image_urls consumes matches without an intermediate list
+    for m in HTML_URL_RE.finditer(html):
+        attr, dq, sq, uq, css, cdn = m.group("attr", "dq", "sq", "uq", "css", "cdn")
+        if attr:
+            val = unescape(dq if dq is not None else sq if sq is not None else uq)
+            if attr.lower().endswith("srcset"):
+                yield from (urljoin(base_url, u) for u in parse_srcset(val))
+            elif val:
+                yield urljoin(base_url, val)
+        elif css:
+            if not css.startswith("data:"):
+                yield urljoin(base_url, unescape(css))
+        else:
+            yield cdn
+
+
+def soup_image_urls(html: str, base_url: str) -> List[str]:
+    soup = BeautifulSoup(html, "lxml")
     urls: List[str] = []
 
-    # <img> elements: src, data-src, srcset, data-srcset
-    for img in soup.find_all("img"):
-        for attr in ["src", "data-src"]:
-            val = img.get(attr)
-            if val:
-                urls.append(urljoin(base_url, val))
-        for attr in ["srcset", "data-srcset"]:
-            val = img.get(attr)
-            if val:
-                for u in parse_srcset(val):
-                    urls.append(urljoin(base_url, u))
-
-    # <source> elements within <picture>
-    for source in soup.find_all("source"):
-        srcset = source.get("srcset")
-        if srcset:
-            for u in parse_srcset(srcset):
-                urls.append(urljoin(base_url, u))
-
-    # Inline styles with background-image: url(...)
-    style_url_re = re.compile(r'url\((?:"|\')?(.*?)(?:"|\')?\)')
-    for el in soup.find_all(style=True):
-        style = el["style"]
-        for m in style_url_re.finditer(style):
-            u = m.group(1)
-            if u and not u.startswith("data:"):
-                urls.append(urljoin(base_url, u))
+    # Walk the DOM once and dispatch on tag name rather than running one find_all per kind
+    for el in soup.select("img, source, [style]"):
+        if el.name == "img":
+            # <img> elements: src, data-src, srcset, data-srcset
+            for attr in ["src", "data-src"]:
+                val = el.get(attr)
+                if val:
+                    urls.append(urljoin(base_url, val))
+            for attr in ["srcset", "data-srcset"]:
+                val = el.get(attr)
+                if val:
+                    urls.extend(urljoin(base_url, u) for u in parse_srcset(val))
+        elif el.name == "source":
+            # <source> elements within <picture>
+            srcset = el.get("srcset")
+            if srcset:
+                urls.extend(urljoin(base_url, u) for u in parse_srcset(srcset))
+
+        # Inline styles with background-image: url(...)
+        style = el.get("style")
+        if style:
+            urls.extend(
+                urljoin(base_url, m.group(1))
+                for m in STYLE_URL_RE.finditer(style)
+                if m.group(1) and not m.group(1).startswith("data:")
+            )
 
     # Also scan raw HTML for CDN image URLs that may be referenced by lazy-load scripts
-    cdn_img_pattern = re.compile(
-        r"https?://[\w.-]*/public/[\w/-]*/riftbound/[\w/-]*/[\w-]*/cards/[\w-]*/(?:full|thumbnail)[^\s'\"]*\.(?:jpg|jpeg|png|webp)",
-        re.IGNORECASE,
-    )
-    for m in cdn_img_pattern.finditer(html):
-        urls.append(m.group(0))
+    urls.extend(m.group(0) for m in CDN_IMG_RE.finditer(html))
+    return urls
 
-    # Deduplicate, normalize by stripping query/fragment
-    def normalize(u: str) -> str:
-        parsed = urlparse(u)
-        return parsed._replace(query="", fragment="").geturl()
 
+def filter_image_urls(urls: Iterable[str]) -> List[str]:
+    # Deduplicate (normalized by stripping query/fragment) and keep only common image
+    # extensions in one pass, parsing each URL once
     seen: Set[str] = set()
     result: List[str] = []
     for u in urls:
@@ -82,118 +186,372 @@ def extract_image_urls(html: str, base_url: str) -> List[str]:
         # Handle protocol-relative URLs
         if u.startswith("//"):
             u = "https:" + u
-        key = normalize(u)
+        parsed = urlparse(u)
+        if not parsed.path.lower().endswith(IMAGE_EXTS):
+            continue
+        key = parsed._replace(query="", fragment="").geturl()
         if key not in seen:
             seen.add(key)
             result.append(u)
-
-    # Keep only common image extensions
-    exts = (".png", ".jpg", ".jpeg", ".webp", ".gif")
-    result = [u for u in result if any(urlparse(u).path.lower().endswith(ext) for ext in exts)]
     return result
 
 
-def file_ext_for_url(u: str) -> str:
-    path = urlparse(u).path.lower()
-    for ext in (".png", ".jpg", ".jpeg", ".webp", ".gif"):
+def file_ext_for_path(path: str) -> str:
+    path = path.lower()
+    for ext in IMAGE_EXTS:
         if path.endswith(ext):
             return ext
     return ".jpg"
 
 
-PREFIX_RE = re.compile(r"/riftbound/latest/([A-Z]+)/cards/")
+PREFIX_RE = re.compile(r"/riftbound/latest/([A-Z]+)/cards/(?:([^/]+)/)?")
+# Asset names in order of preference when a card is exposed at several sizes
+ASSET_PREFERENCE = ("full-desktop", "full", "thumbnail")
 
 
-def detect_prefix(u: str) -> str | None:
-    m = PREFIX_RE.search(urlparse(u).path)
+def detect_prefix(path: str) -> str | None:
+    m = PREFIX_RE.search(path)
     return m.group(1) if m else None
 
 
-def download_images(urls: Iterable[str], out_dir: Path) -> None:
-    out_dir.mkdir(parents=True, exist_ok=True)
+def asset_rank(path: str) -> int:
+    stem = path.rsplit("/", 1)[-1].lower()
+    for rank, name in enumerate(ASSET_PREFERENCE):
+        if stem.startswith(name):
+            return rank
+    return len(ASSET_PREFERENCE)
+
+
+def pick_card_assets(urls: Iterable[str]) -> List[str]:
+    """
+    Keep a single URL per card code, preferring the largest asset per ASSET_PREFERENCE.
+    URLs that do not look like card assets are passed through unchanged.
+    """
+    best: Dict[tuple[str, str], tuple[int, str]] = {}
+    result: List[str] = []
+    for u in urls:
+        path = urlparse(u).path
+        m = PREFIX_RE.search(path)
+        if not m or not m.group(2):
+            result.append(u)
+            continue
+        key = (m.group(1), m.group(2))
+        rank = asset_rank(path)
+        if key not in best or rank < best[key][0]:
+            best[key] = (rank, u)
+    result.extend(u for _, u in best.values())
+    return result
+
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/124.0.0.0 Safari/537.36"
-        )
+def download_file(session: requests.Session, url: str, dest: Path, entry: Dict[str, Any] | None = None) -> Dict[str, Any] | None:
+    """
+    Fetch `url` into `dest` and return the cache entry to record for it, or None when the
+    copy already on disk is current. `entry` is the cached record from a previous run: if it
+    says `dest` came from this URL, the download is skipped or revalidated with its validators.
+    """
+    headers: Dict[str, str] = {}
+    if entry and entry.get("file") == dest.as_posix() and dest.exists() and dest.stat().st_size > 0:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        if not headers:
+            return None
+
+    # Stream the body straight to disk rather than holding the whole image in memory.
+    # Write to a sibling temp file so a failed transfer never leaves a truncated image behind.
+    tmp = dest.with_name(dest.name + ".part")
+    with session.get(url, headers=headers, stream=True, timeout=30) as r:
+        if r.status_code == 304:
+            return None
+        r.raise_for_status()
+        r.raw.decode_content = True
+        try:
+            with open(tmp, "wb", buffering=COPY_CHUNK) as f:
+                shutil.copyfileobj(r.raw, f, length=COPY_CHUNK)
+            os.replace(tmp, dest)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    return {
+        "status": r.status_code,
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
+        "checked": time.time(),
+        "file": dest.as_posix(),
     }
 
-    counters: Dict[str, int] = {}
 
+def download_tasks(
+    session: requests.Session,
+    tasks: list[tuple[str, Path]],
+    cache: Dict[str, Dict[str, Any]],
+    max_workers: int = MAX_WORKERS,
+    verbose: bool = False,
+) -> None:
+    """
+    Download `(url, dest)` pairs concurrently behind a single progress bar.
+    Failures are always reported; per-file results only when `verbose`.
+    """
+    if not tasks:
+        return
+    # Create each destination directory exactly once, before any worker starts writing
+    for subdir in {dest.parent for _, dest in tasks}:
+        subdir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool, tqdm(total=len(tasks), unit="img") as bar:
+        futures = {pool.submit(download_file, session, u, dest, cache.get(u)): (u, dest) for u, dest in tasks}
+        for fut in as_completed(futures):
+            u, dest = futures[fut]
+            bar.update(1)
+            try:
+                entry = fut.result()
+            except Exception as e:
+                tqdm.write(f"Failed to download {u}: {e}")
+                continue
+            if entry is None:
+                if verbose:
+                    tqdm.write(f"Up to date {dest}")
+            else:
+                cache[u] = {**cache.get(u, {}), **entry}
+                record_file(cache, u, dest)
+                if verbose:
+                    tqdm.write(f"Saved {dest}")
+
+
+def download_images(session: requests.Session, urls: Iterable[str], out_dir: Path, verbose: bool = False) -> None:
+    # Group by prefix and number each group in input order, so every worker receives a
+    # final filename up front and no counter is shared between concurrent downloads.
+    groups: DefaultDict[str, List[tuple[str, str]]] = defaultdict(list)
     for u in urls:
-        prefix = detect_prefix(u) or "misc"
+        # Parse once and share the path between both helpers
+        path = urlparse(u).path
+        groups[detect_prefix(path) or "misc"].append((u, file_ext_for_path(path)))
+
+    tasks: list[tuple[str, Path]] = []
+    for prefix, group in groups.items():
         subdir = out_dir / prefix
-        subdir.mkdir(parents=True, exist_ok=True)
-        next_idx = counters.get(prefix, 1)
-        ext = file_ext_for_url(u)
-        dest = subdir / f"{next_idx:03d}{ext}"
-        try:
-            r = requests.get(u, headers=headers, timeout=30)
-            r.raise_for_status()
-            dest.write_bytes(r.content)
-            counters[prefix] = next_idx + 1
-            print(f"Saved {dest}")
-        except Exception as e:
-            print(f"Failed to download {u}: {e}")
+        tasks.extend((u, subdir / f"{idx:03d}{ext}") for idx, (u, ext) in enumerate(group, 1))
 
+    cache_path = out_dir / CACHE_NAME
+    cache = load_cache(cache_path)
+    try:
+        download_tasks(session, tasks, cache, verbose=verbose)
+    finally:
+        save_cache(cache_path, cache)
 
-def try_head(url: str, headers: dict) -> bool:
+
+def load_cache(path: Path) -> Dict[str, Dict[str, Any]]:
     try:
-        r = requests.head(url, headers=headers, timeout=15, allow_redirects=True)
-        return r.status_code == 200
-    except requests.RequestException:
-        return False
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path: Path, cache: Dict[str, Dict[str, Any]]) -> None:
+    # Write to a temp file and swap it in so an interrupted run never corrupts the cache
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp, path)
 
 
-def fallback_guess_by_prefixes(out_dir: Path, prefixes: list[str], start: int = 1, miss_limit: int = 3, asset: str | None = None) -> None:
+def record_file(cache: Dict[str, Dict[str, Any]], url: str, dest: Path) -> None:
     """
-    Guess image URLs by iterating <PREFIX>-001.. for each prefix and checking CDN for existence.
-    Downloads only the specified asset filename under each code (no fallback to other sizes).
-    Stops per-prefix after `miss_limit` consecutive misses.
+    Record that `dest` now holds `url`'s image, dropping the claim of any other URL that
+    previously wrote there so its validators are never trusted for someone else's bytes.
+    """
+    path = dest.as_posix()
+    for other, entry in cache.items():
+        if other != url and entry.get("file") == path:
+            del entry["file"]
+    cache[url]["file"] = path
+
+
+def try_fetch(cdn: urllib3.HTTPSConnectionPool, url: str, staging: Path) -> Dict[str, Any] | None:
+    """
+    GET `url` as an existence probe, streaming a hit straight into `staging` so that finding
+    an asset and downloading it cost a single request. Returns a cache entry describing the
+    result, or None if the request failed. Transient errors are retried by the `cdn` pool,
+    so None means retries were exhausted rather than that the asset is missing.
+    Redirects are not followed: the pool is pinned to one host, and the card CDN serves
+    assets directly, so a 3xx is recorded like any other non-200 status, i.e. as a miss.
     """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/124.0.0.0 Safari/537.36"
-        )
+    try:
+        r = cdn.request("GET", urlparse(url).path, preload_content=False, decode_content=True, redirect=False)
+        try:
+            if r.status == 200:
+                with open(staging, "wb", buffering=COPY_CHUNK) as f:
+                    shutil.copyfileobj(r, f, length=COPY_CHUNK)
+            else:
+                # Drain the (small) error body so the connection can be reused
+                r.drain_conn()
+        finally:
+            r.release_conn()
+    except (urllib3.exceptions.HTTPError, OSError):
+        staging.unlink(missing_ok=True)
+        return None
+    return {
+        "status": r.status,
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
+        "checked": time.time(),
     }
-    out_dir.mkdir(parents=True, exist_ok=True)
-    for prefix in prefixes:
-        print(f"Scanning prefix {prefix}…")
-        base = f"https://cdn.rgpub.io/public/live/map/riftbound/latest/{prefix}/cards/{{code}}/"
-        miss_streak = 0
-        subdir = out_dir / prefix
-        subdir.mkdir(parents=True, exist_ok=True)
-        idx = 1
-        # Use a wide upper bound; we'll break on miss streak
-        for i in range(start, 2000):
-            code = f"{prefix}-{i:03d}"
-            chosen = None
-            fname = (asset or "full-desktop.jpg").lstrip("/")
-            candidate = base.format(code=code) + fname
-            if try_head(candidate, headers):
-                chosen = candidate
-
-            if not chosen:
+
+
+def probe_url(
+    cdn: urllib3.HTTPSConnectionPool, url: str, staging: Path, cache: Dict[str, Dict[str, Any]]
+) -> tuple[Dict[str, Any] | None, bool]:
+    """
+    Answer from `cache` when possible: hits are reused indefinitely, while misses are only
+    trusted for MISS_TTL seconds since new cards are published past the end of a set.
+    Returns the entry and whether the body was fetched into `staging`.
+    """
+    entry = cache.get(url)
+    if entry is not None and (entry["status"] == 200 or time.time() - entry["checked"] < MISS_TTL):
+        return entry, False
+    entry = try_fetch(cdn, url, staging)
+    return entry, entry is not None and entry["status"] == 200
+
+
+def probe_prefix(
+    cdn: urllib3.HTTPSConnectionPool,
+    pool: ThreadPoolExecutor,
+    prefix: str,
+    subdir: Path,
+    fname: str,
+    start: int,
+    miss_limit: int,
+    cache: Dict[str, Dict[str, Any]],
+    bar: tqdm,
+    window: int = PROBE_WINDOW,
+) -> List[tuple[str, Path | None]]:
+    """
+    Probe candidate URLs for `prefix` with up to `window` requests in flight.
+    Results are consumed in code order, so the consecutive-miss stop condition behaves
+    exactly like a sequential scan; probes already queued past the stopping point are still
+    completed and cached, so a later run stops at the same place without touching the network.
+    Returns `(url, staged)` for each hit, where `staged` holds the already-downloaded body
+    (None when the hit came from `cache`). Probe results are recorded in `cache`, and `bar`
+    advances once per hit.
+    """
+    base = f"https://{CDN_HOST_HINT}/public/live/map/riftbound/latest/{prefix}/cards/{{code}}/"
+    # Use a wide upper bound; we'll break on miss streak
+    codes = (f"{prefix}-{i:03d}" for i in range(start, 2000))
+    pending: Deque[tuple[str, Path, Future[tuple[Dict[str, Any] | None, bool]]]] = deque()
+
+    def refill() -> None:
+        for code in islice(codes, window - len(pending)):
+            url = base.format(code=code) + fname
+            staging = subdir / f"{code}.part"
+            pending.append((url, staging, pool.submit(probe_url, cdn, url, staging, cache)))
+
+    hits: List[tuple[str, Path | None]] = []
+    miss_streak = 0
+    fail_streak = 0
+    completed = False
+    try:
+        refill()
+        while pending:
+            # Leave the probe queued until its result is in, so an interruption here still
+            # finds its staged body below
+            url, staging, fut = pending[0]
+            entry, staged = fut.result()
+            pending.popleft()
+            if entry is None:
+                # Still failing after retries: not evidence that the set has ended, unless
+                # nothing is getting through at all
+                tqdm.write(f"Could not check {url}; skipping.")
+                fail_streak += 1
+                if fail_streak >= window:
+                    tqdm.write(f"Giving up on {prefix} after {fail_streak} failed requests in a row.")
+                    break
+                refill()
+                continue
+            fail_streak = 0
+            cache[url] = entry
+            if entry["status"] == 200:
+                hits.append((url, staging if staged else None))
+                bar.update(1)
+                miss_streak = 0
+            else:
                 miss_streak += 1
                 if miss_streak >= miss_limit:
-                    print(f"No more images found for {prefix} after {miss_streak} misses. Moving on.")
+                    tqdm.write(f"No more images found for {prefix} after {miss_streak} misses. Moving on.")
                     break
-                continue
-
-            miss_streak = 0
-            dest = subdir / f"{idx:03d}.jpg"
-            try:
-                r = requests.get(chosen, headers=headers, timeout=30)
-                r.raise_for_status()
-                dest.write_bytes(r.content)
-                print(f"Saved {dest} from {chosen}")
-                idx += 1
-            except Exception as e:
-                print(f"Failed to download {chosen}: {e}")
+            refill()
+        # Let speculative probes past the stopping point finish, discarding their bodies but keeping
+        # their answers: the next run queues the same lookahead and can serve it all from the cache
+        for url, staging, fut in pending:
+            entry, _ = fut.result()
+            staging.unlink(missing_ok=True)
+            if entry is not None:
+                cache[url] = entry
+        completed = True
+    finally:
+        if not completed:
+            # Interrupted or failed: nothing will rename the staged bodies, so remove them
+            for _, staged in hits:
+                if staged is not None:
+                    staged.unlink(missing_ok=True)
+            for _, staging, fut in pending:
+                if not fut.cancel():
+                    # Wait for in-flight probes so their staged bodies exist before removal
+                    wait([fut])
+                staging.unlink(missing_ok=True)
+    return hits
+
+
+def fallback_guess_by_prefixes(
+    session: requests.Session,
+    out_dir: Path,
+    prefixes: list[str],
+    start: int = 1,
+    miss_limit: int = 3,
+    asset: str | None = None,
+    verbose: bool = False,
+) -> None:
+    """
+    Guess image URLs by iterating <PREFIX>-001.. for each prefix and checking CDN for existence.
+    Downloads only the specified asset filename under each code (no fallback to other sizes).
+    Stops per-prefix after `miss_limit` consecutive misses.
+    """
+    fname = (asset or "full-desktop.jpg").lstrip("/")
+    cache_path = out_dir / CACHE_NAME
+    cache = load_cache(cache_path)
+    tasks: list[tuple[str, Path]] = []
+    try:
+        with make_cdn_pool() as cdn, ThreadPoolExecutor(max_workers=PROBE_WINDOW) as pool:
+            for prefix in prefixes:
+                subdir = out_dir / prefix
+                subdir.mkdir(parents=True, exist_ok=True)
+                with tqdm(desc=f"Scanning {prefix}", unit="img") as bar:
+                    hits = probe_prefix(cdn, pool, prefix, subdir, fname, start, miss_limit, cache, bar)
+                if not hits:
+                    # The directory only existed to stage bodies; don't leave it behind empty
+                    with suppress(OSError):
+                        subdir.rmdir()
+                try:
+                    for idx, (u, staged) in enumerate(hits, 1):
+                        dest = subdir / f"{idx:03d}.jpg"
+                        if staged is None:
+                            # Known from a previous run: let download_tasks skip or revalidate it
+                            tasks.append((u, dest))
+                            continue
+                        os.replace(staged, dest)
+                        record_file(cache, u, dest)
+                        if verbose:
+                            tqdm.write(f"Saved {dest}")
+                finally:
+                    # After a full pass every staged body has been renamed; this only removes
+                    # leftovers when the loop above stopped early
+                    for _, staged in hits:
+                        if staged is not None:
+                            staged.unlink(missing_ok=True)
+        download_tasks(session, tasks, cache, verbose=verbose)
+    finally:
+        save_cache(cache_path, cache)
 
 
 def main() -> None:
@@ -209,33 +567,30 @@ def main() -> None:
             "No fallback is attempted if the asset is missing. Default: full-desktop.jpg"
         ),
     )
+    parser.add_argument("--verbose", action="store_true", help="Log every saved or up-to-date file instead of only a progress bar")
     args = parser.parse_args()
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/124.0.0.0 Safari/537.36"
-        )
-    }
-    print(f"Fetching {URL}…")
-    resp = requests.get(URL, headers=headers, timeout=30)
-    resp.raise_for_status()
-    urls = extract_image_urls(resp.text, URL)
-    if not urls:
-        print("No images in static HTML. Falling back to pattern-based download (PREFIX-###)…")
-        fallback_guess_by_prefixes(
-            OUT_DIR,
-            prefixes=args.prefixes,
-            start=args.start,
-            miss_limit=args.miss_limit,
-            asset=args.asset,
-        )
-        print("Done.")
-        return
-    # Stable ordering so numbering is deterministic
-    urls_sorted = sorted(urls)
-    print(f"Found {len(urls_sorted)} image URLs. Downloading…")
-    download_images(urls_sorted, OUT_DIR)
+    with make_session() as session:
+        print(f"Fetching {URL}…")
+        resp = session.get(URL, timeout=30)
+        resp.raise_for_status()
+        urls = extract_image_urls(resp.text, URL)
+        if not urls:
+            print("No images in static HTML. Falling back to pattern-based download (PREFIX-###)…")
+            fallback_guess_by_prefixes(
+                session,
+                OUT_DIR,
+                prefixes=args.prefixes,
+                start=args.start,
+                miss_limit=args.miss_limit,
+                asset=args.asset,
+                verbose=args.verbose,
+            )
+            print("Done.")
+            return
+        # Stable ordering so numbering is deterministic
+        urls_sorted = sorted(pick_card_assets(urls))
+        print(f"Found {len(urls_sorted)} image URLs. Downloading…")
+        download_images(session, urls_sorted, OUT_DIR, verbose=args.verbose)
     print("Done.")
 
 
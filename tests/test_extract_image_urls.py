@@ -0,0 +1,36 @@
+import unittest
+
+from main import extract_image_urls
+
+
+BASE = "https://example.com/cards/"
+
+
+class ExtractImageUrlsTest(unittest.TestCase):
+    def test_multiline_srcset_is_extracted(self):
+        imgs = "".join(f'<img src="/img/{i:03d}.jpg">' for i in range(12))
+        html = (
+            f"<html><body>{imgs}<picture>"
+            '<source srcset="/img/wide.webp 1200w,\n /img/narrow.webp 600w">'
+            "</picture></body></html>"
+        )
+        urls = extract_image_urls(html, BASE)
+        self.assertIn("https://example.com/img/wide.webp", urls)
+        self.assertIn("https://example.com/img/narrow.webp", urls)
+        self.assertEqual(len(urls), 14)
+
+    def test_unquoted_attributes_are_extracted_alongside_quoted_ones(self):
+        quoted = "".join(f'<img src="/img/q{i:03d}.jpg">' for i in range(10))
+        unquoted = "".join(f"<img src=/img/u{i:03d}.jpg>" for i in range(12))
+        urls = extract_image_urls(f"<html><body>{quoted}{unquoted}</body></html>", BASE)
+        self.assertEqual(len(urls), 22)
+        self.assertIn("https://example.com/img/u000.jpg", urls)
+
+    def test_inline_script_src_assignment_is_ignored(self):
+        imgs = "".join(f'<img src="/img/{i:03d}.jpg">' for i in range(12))
+        html = f'<html><body>{imgs}<script>img.src = "/img/js.png";</script></body></html>'
+        self.assertNotIn("https://example.com/img/js.png", extract_image_urls(html, BASE))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import io
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import urllib3
+from tqdm import tqdm
+
+from main import MISS_TTL, probe_prefix
+
+
+class StubResponse(io.BytesIO):
+    def __init__(self, status: int):
+        super().__init__(b"img" if status == 200 else b"")
+        self.status = status
+        self.headers = {}
+
+    def drain_conn(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+class StubPool:
+    """Stands in for the CDN pool: answers 200 for `present` codes, fails for `failing`, else 404."""
+
+    def __init__(self, present, failing=()):
+        self.present = set(present)
+        self.failing = set(failing)
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, path, **kwargs):
+        with self._lock:
+            self.requests += 1
+        code = int(path.split("/cards/")[1].split("/")[0].split("-")[1])
+        if code in self.failing:
+            raise urllib3.exceptions.ProtocolError("connection reset")
+        return StubResponse(200 if code in self.present else 404)
+
+
+def code_of(url: str) -> int:
+    return int(url.split("/cards/")[1].split("/")[0].split("-")[1])
+
+
+class ProbePrefixTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.subdir = Path(self.tmp.name)
+        self.pool = ThreadPoolExecutor(max_workers=4)
+
+    def tearDown(self):
+        self.pool.shutdown()
+        self.tmp.cleanup()
+
+    def probe(self, cdn, cache, miss_limit=3):
+        with tqdm(disable=True) as bar, redirect_stdout(io.StringIO()):
+            hits = probe_prefix(cdn, self.pool, "OGN", self.subdir, "full.jpg", 1, miss_limit, cache, bar, window=4)
+        for _, staged in hits:
+            if staged is not None:
+                staged.unlink()
+        return hits
+
+    def test_stops_after_miss_limit_consecutive_misses(self):
+        cache = {}
+        hits = self.probe(StubPool(present={1, 2, 3, 4, 5, 9}), cache)
+        self.assertEqual([code_of(u) for u, _ in hits], [1, 2, 3, 4, 5])
+        self.assertTrue(all(staged is not None for _, staged in hits))
+        self.assertEqual(sorted(p.name for p in self.subdir.iterdir()), [])
+
+    def test_fresh_cached_miss_is_reused_and_stale_one_is_reprobed(self):
+        cdn = StubPool(present={1, 2, 3})
+        url = "https://cdn.rgpub.io/public/live/map/riftbound/latest/OGN/cards/OGN-002/full.jpg"
+        cache = {url: {"status": 404, "checked": time.time()}}
+        hits = self.probe(cdn, cache, miss_limit=1)
+        self.assertEqual([code_of(u) for u, _ in hits], [1])
+
+        cache[url]["checked"] = time.time() - MISS_TTL - 1
+        hits = self.probe(cdn, cache, miss_limit=1)
+        self.assertEqual([code_of(u) for u, _ in hits], [1, 2, 3])
+
+    def test_failures_do_not_advance_the_miss_streak(self):
+        cache = {}
+        hits = self.probe(StubPool(present={1, 2, 5}, failing={3}), cache, miss_limit=2)
+        self.assertEqual([code_of(u) for u, _ in hits], [1, 2, 5])
+        self.assertFalse(any(code_of(u) == 3 for u in cache))
+
+    def test_second_run_issues_no_probe_requests(self):
+        cache = {}
+        self.probe(StubPool(present={1, 2, 3, 4, 5, 8}), cache)
+        cdn = StubPool(present={1, 2, 3, 4, 5, 8})
+        hits = self.probe(cdn, cache)
+        self.assertEqual(cdn.requests, 0)
+        self.assertEqual([code_of(u) for u, _ in hits], [1, 2, 3, 4, 5, 8])
+        self.assertTrue(all(staged is None for _, staged in hits))
+
+
+if __name__ == "__main__":
+    unittest.main()